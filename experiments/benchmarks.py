@@ -0,0 +1,120 @@
+"""
+Throughput benchmarks for the orchestration subsystems.
+
+Usage (from the repository root):
+    python -m experiments.benchmarks --benchmark scheduler --nodes 100000
+    python -m experiments.benchmarks --benchmark telemetry --nodes 10000 --events 2000000
+"""
+
+import argparse
+import time
+import numpy as np
+from typing import Dict
+from src.core.nodes import IoRTNode, NodeType, SafetyLevel
+from src.core.scheduler import TaskScheduler, Task
+from src.core.telemetry import TelemetryIngestionPipeline, generator_source
+
+def build_fleet(num_nodes: int, seed: int = 42) -> list:
+    # Same per-type distributions as IoRTSimulation.setup_network, without the O(n^2) trust walk.
+    rng = np.random.default_rng(seed)
+    ranges = {
+        NodeType.ROBOT: ((200, 800), (1, 15), (3, 2)),
+        NodeType.EDGE_SENSOR: ((20, 100), (3, 25), (4, 2)),
+        NodeType.EDGE_COMPUTER: ((800, 2000), (2, 12), (5, 1)),
+        NodeType.CLOUD: ((2000, 10000), (30, 150), (6, 1))
+    }
+    node_types = rng.choice(len(NodeType), size=num_nodes, p=[0.4, 0.3, 0.2, 0.1])
+    nodes = []
+    for i, type_index in enumerate(node_types):
+        node_type = list(NodeType)[type_index]
+        compute, latency, trust = ranges[node_type]
+        nodes.append(IoRTNode(
+            node_id=f"node_{i:06d}",
+            node_type=node_type,
+            compute_capacity=float(rng.uniform(*compute)),
+            network_latency=float(rng.uniform(*latency)),
+            trust_score=float(rng.beta(*trust)),
+            position=(float(rng.uniform(0, 500)), float(rng.uniform(0, 500))),
+            safety_critical=bool(rng.random() > 0.5)
+        ))
+    return nodes
+
+def _make_tasks(rng, count: int, demand_range: tuple, prefix: str) -> list:
+    return [
+        Task(
+            task_id=f"{prefix}_{i:07d}",
+            compute_demand=float(rng.uniform(*demand_range)),
+            max_latency=float(rng.uniform(10, 100)),
+            min_trust=float(rng.uniform(0.3, 0.85)),
+            safety_level=SafetyLevel(int(rng.integers(1, 5)))
+        )
+        for i in range(count)
+    ]
+
+def run_scheduler_benchmark(num_nodes: int = 100000, num_tasks: int = 50000, seed: int = 42,
+                            saturation_factor: float = 1.5) -> Dict:
+    nodes = build_fleet(num_nodes, seed)
+    rng = np.random.default_rng(seed + 1)
+    start = time.perf_counter()
+    scheduler = TaskScheduler(nodes)
+    build_s = time.perf_counter() - start
+
+    # Steady state: small tasks against a lightly loaded fleet.
+    tasks = _make_tasks(rng, num_tasks, (1, 50), "task")
+    results = list(scheduler.place_stream(tasks))
+
+    # Churn: release half of the placements, re-place them and re-tier a sample of nodes.
+    placed = [r['task_id'] for r in results if r['success']]
+    for task_id in placed[::2]:
+        scheduler.release(task_id)
+    list(scheduler.place_stream(task for task in tasks[::2] if task.task_id not in scheduler.assignments))
+    for node in nodes[::max(1, num_nodes // 1000)]:
+        node.quantum_trust_score = min(1.0, node.quantum_trust_score + 0.05)
+        scheduler.refresh_node(node.node_id)
+
+    steady = scheduler.report()
+    steady['index_build_s'] = build_s
+
+    # Saturation: a fresh index offered saturation_factor times the fleet's total budget, so
+    # boundary-pool probing and rejections dominate the tail.
+    scheduler = TaskScheduler(nodes)
+    demand_range = (50, 1000)
+    num_saturating = int(saturation_factor * sum(scheduler.budget) / np.mean(demand_range))
+    list(scheduler.place_stream(_make_tasks(rng, num_saturating, demand_range, "saturate")))
+    saturation = scheduler.report()
+    saturation['offered_tasks'] = num_saturating
+
+    return {'steady': steady, 'saturation': saturation}
+
+def run_telemetry_benchmark(num_nodes: int = 10000, num_events: int = 2000000, seed: int = 42) -> Dict:
+    # Default TelemetryConfig with the anomaly detector attached, so rescoring is part of the figure.
+    from src.security.anomaly_detection import FederatedAnomalyDetector
+    nodes = build_fleet(num_nodes, seed)
+    rng = np.random.default_rng(seed + 1)
+    node_ids = [node.node_id for node in nodes]
+    indices = rng.integers(0, num_nodes, num_events)
+    latencies = np.array([node.network_latency for node in nodes])[indices] * rng.lognormal(0.0, 0.2, num_events)
+    records = list(zip([node_ids[i] for i in indices], latencies.tolist()))
+
+    pipeline = TelemetryIngestionPipeline(nodes, anomaly_detector=FederatedAnomalyDetector(nodes))
+    return pipeline.run(generator_source(records))
+
+def main():
+    parser = argparse.ArgumentParser(description='Quantum-IoRT benchmarks')
+    parser.add_argument('--benchmark', type=str, default='scheduler', choices=['scheduler', 'telemetry'],
+                        help='Benchmark to run')
+    parser.add_argument('--nodes', type=int, default=100000, help='Number of nodes in the fleet')
+    parser.add_argument('--tasks', type=int, default=50000, help='Number of tasks to place')
+    parser.add_argument('--events', type=int, default=2000000, help='Number of telemetry events to ingest')
+    args = parser.parse_args()
+
+    if args.benchmark == 'scheduler':
+        report = run_scheduler_benchmark(args.nodes, args.tasks)
+        print("Scheduler Benchmark (steady):", report['steady'])
+        print("Scheduler Benchmark (saturation):", report['saturation'])
+    elif args.benchmark == 'telemetry':
+        report = run_telemetry_benchmark(args.nodes, args.events)
+        print("Telemetry Benchmark:", report)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,300 @@
+import heapq
+import random
+import time
+import numpy as np
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from .nodes import NodeType, SafetyLevel
+
+@dataclass
+class Task:
+    task_id: str
+    compute_demand: float
+    max_latency: float = float('inf')
+    min_trust: float = 0.0
+    safety_level: SafetyLevel = SafetyLevel.LOW
+    node_types: Optional[Tuple[NodeType, ...]] = None
+
+@dataclass
+class SchedulerConfig:
+    # Lower bounds of the quantum-trust tiers and upper bounds of the latency tiers
+    # each NodeType pool is split into.
+    trust_tiers: Tuple[float, ...] = (0.0, 0.3, 0.4, 0.5, 0.55, 0.6, 0.65, 0.7, 0.75, 0.8, 0.85, 0.9, 0.95)
+    latency_tiers: Tuple[float, ...] = (2.0, 5.0, 10.0, 15.0, 20.0, 30.0, 50.0, 75.0, 100.0, 150.0, float('inf'))
+    batch_size: int = 1024
+    latency_sample_size: int = 100000
+
+class TaskScheduler:
+    def __init__(self, nodes: List, config: SchedulerConfig = None):
+        self.config = config or SchedulerConfig()
+        self.nodes = nodes
+        self.node_index = {node.node_id: i for i, node in enumerate(nodes)}
+
+        self.budget = [node.compute_capacity * node.safety_envelope['max_compute_load'] for node in nodes]
+        self.load = [0.0] * len(nodes)
+        self.version = [0] * len(nodes)
+        self.node_pool = [None] * len(nodes)
+        self.assignments = {}
+        self.trust = [node.quantum_trust_score for node in nodes]
+        self.latency = [node.network_latency for node in nodes]
+        self.envelope = [(node.safety_envelope['max_latency'], node.safety_envelope['quantum_safety_threshold'])
+                         for node in nodes]
+        self.envelope_latency = Counter(latency for latency, _ in self.envelope)
+        self.envelope_trust = Counter(trust for _, trust in self.envelope)
+        self._refresh_safety_bounds()
+
+        # Per NodeType, a grid of max-heaps indexed by [trust tier][latency tier], keyed by remaining
+        # capacity then trust. Entries are invalidated lazily through the per-node version counter,
+        # and every heap's top is kept live so its remaining capacity can be cached in top_remaining.
+        shape = (len(self.config.trust_tiers), len(self.config.latency_tiers))
+        self.pools = {node_type: [[[] for _ in range(shape[1])] for _ in range(shape[0])]
+                      for node_type in NodeType}
+        self.top_remaining = {node_type: np.full(shape, -np.inf) for node_type in NodeType}
+        self.pool_size = {node_type: np.zeros(shape, dtype=np.int64) for node_type in NodeType}
+        for i in range(len(nodes)):
+            self._index_node(i)
+
+        # Placement latencies are kept as a fixed-size reservoir sample so long streams stay bounded.
+        self.placement_latencies = []
+        self._latency_rng = random.Random(0)
+        self.stats = {'placed': 0, 'rejected': 0, 'released': 0, 'elapsed_s': 0.0, 'wall_s': 0.0,
+                      'max_latency_s': 0.0}
+
+    def _pool_key(self, node) -> Tuple:
+        trust_tier = bisect_right(self.config.trust_tiers, node.quantum_trust_score) - 1
+        latency_tier = bisect_left(self.config.latency_tiers, node.network_latency)
+        return node.node_type, max(trust_tier, 0), latency_tier
+
+    def _index_node(self, idx: int):
+        node = self.nodes[idx]
+        key = self._pool_key(node)
+        self.node_pool[idx] = key
+        self.pool_size[key[0]][key[1], key[2]] += 1
+        self._push(idx)
+
+    def _push(self, idx: int):
+        node_type, trust_tier, latency_tier = self.node_pool[idx]
+        remaining = self.budget[idx] - self.load[idx]
+        if remaining > 0:
+            entry = (-remaining, -self.trust[idx], idx, self.version[idx])
+            heap = self.pools[node_type][trust_tier][latency_tier]
+            heapq.heappush(heap, entry)
+            # Each node has at most one live entry, so a heap longer than twice its pool is mostly
+            # stale entries left behind by earlier placements and releases.
+            if len(heap) > 2 * self.pool_size[node_type][trust_tier, latency_tier] + 16:
+                heap[:] = [e for e in heap if e[3] == self.version[e[2]]]
+                heapq.heapify(heap)
+        self._sync(self.node_pool[idx])
+
+    def _sync(self, pool_key: Tuple):
+        node_type, trust_tier, latency_tier = pool_key
+        heap = self.pools[node_type][trust_tier][latency_tier]
+        while heap and heap[0][3] != self.version[heap[0][2]]:
+            heapq.heappop(heap)
+        self.top_remaining[node_type][trust_tier, latency_tier] = -heap[0][0] if heap else -np.inf
+
+    def _refresh_safety_bounds(self):
+        # The loosest envelope in the fleet tightens HIGH/CRITICAL tasks at the tier level; nodes
+        # only need an individual envelope check when envelopes differ across the fleet.
+        # Counters of envelope values keep this proportional to the number of distinct envelopes.
+        self.safety_max_latency = max(self.envelope_latency, default=float('inf'))
+        self.safety_min_trust = min(self.envelope_trust, default=0.0)
+        self.uniform_envelope = len(self.envelope_latency) <= 1 and len(self.envelope_trust) <= 1
+
+    def _requirements(self, task: Task) -> Tuple[float, float, bool]:
+        if task.safety_level.value < SafetyLevel.HIGH.value:
+            return task.max_latency, task.min_trust, False
+        return (min(task.max_latency, self.safety_max_latency),
+                max(task.min_trust, self.safety_min_trust),
+                not self.uniform_envelope)
+
+    def _node_eligible(self, idx: int, max_latency: float, min_trust: float, check_envelope: bool) -> bool:
+        if self.latency[idx] > max_latency or self.trust[idx] < min_trust:
+            return False
+        if check_envelope:
+            envelope_latency, envelope_trust = self.envelope[idx]
+            if self.latency[idx] > envelope_latency or self.trust[idx] < envelope_trust:
+                return False
+        return True
+
+    def _best_candidate(self, task: Task) -> Optional[Tuple]:
+        max_latency, min_trust, check_envelope = self._requirements(task)
+        trust_tiers = self.config.trust_tiers
+        latency_tiers = self.config.latency_tiers
+        first_trust = max(bisect_right(trust_tiers, min_trust) - 1, 0)
+        last_latency = min(bisect_left(latency_tiers, max_latency), len(latency_tiers) - 1)
+        trust_boundary = check_envelope or trust_tiers[first_trust] < min_trust
+        latency_boundary = check_envelope or latency_tiers[last_latency] > max_latency
+        exact_trust = len(trust_tiers) if check_envelope else first_trust + trust_boundary
+        exact_latency = last_latency + 1 - latency_boundary
+        demand = task.compute_demand
+        node_types = task.node_types or tuple(NodeType)
+        best = None
+
+        # Pools entirely inside the trust and latency bounds: their cached tops are all eligible.
+        for node_type in node_types:
+            tops = self.top_remaining[node_type][exact_trust:, :exact_latency]
+            if tops.size == 0:
+                continue
+            t, l = np.unravel_index(np.argmax(tops), tops.shape)
+            if tops[t, l] >= demand:
+                entry = self.pools[node_type][exact_trust + t][l][0]
+                if best is None or entry[:2] < best[:2]:
+                    best = entry
+
+        # Boundary pools hold some ineligible nodes; pop past them while their top can still beat
+        # the best exact candidate, then restore what was popped. Probing only stops once the top can
+        # no longer win, so a task is never rejected while an eligible node exists.
+        floor = demand if best is None else max(demand, -best[0])
+        held = []
+        for node_type in node_types:
+            tops = self.top_remaining[node_type]
+            grid = self.pools[node_type]
+            boundary = []
+            if trust_boundary:
+                boundary.extend((t, l) for t in range(first_trust, exact_trust)
+                                for l in np.nonzero(tops[t, :last_latency + 1] >= floor)[0])
+            if latency_boundary and exact_trust < len(trust_tiers):
+                boundary.extend((exact_trust + t, last_latency)
+                                for t in np.nonzero(tops[exact_trust:, last_latency] >= floor)[0])
+            for t, l in boundary:
+                heap = grid[t][l]
+                while True:
+                    while heap and heap[0][3] != self.version[heap[0][2]]:
+                        heapq.heappop(heap)
+                    if not heap or -heap[0][0] < demand or (best is not None and heap[0][:2] >= best[:2]):
+                        break
+                    if self._node_eligible(heap[0][2], max_latency, min_trust, check_envelope):
+                        best = heap[0]
+                        break
+                    held.append((heap, heapq.heappop(heap)))
+
+        for heap, entry in held:
+            heapq.heappush(heap, entry)
+        return best
+
+    def place(self, task: Task) -> Dict:
+        start = time.perf_counter()
+        result = self._place(task)
+        self.stats['wall_s'] += time.perf_counter() - start
+        return result
+
+    def _place(self, task: Task) -> Dict:
+        start = time.perf_counter()
+        if task.task_id in self.assignments:
+            best, reason = None, 'Task already assigned'
+        elif not task.compute_demand > 0 or task.compute_demand == float('inf'):
+            best, reason = None, 'Compute demand must be positive'
+        else:
+            best, reason = self._best_candidate(task), 'No eligible node with sufficient capacity'
+        if best is None:
+            result = {'task_id': task.task_id, 'success': False, 'node_id': None, 'reason': reason}
+            self.stats['rejected'] += 1
+        else:
+            idx = best[2]
+            self.load[idx] += task.compute_demand
+            self.version[idx] += 1
+            self._push(idx)
+            self.assignments[task.task_id] = (idx, task.compute_demand)
+            node = self.nodes[idx]
+            result = {
+                'task_id': task.task_id,
+                'success': True,
+                'node_id': node.node_id,
+                'node_type': node.node_type.value,
+                'load_fraction': self.load[idx] / node.compute_capacity
+            }
+            self.stats['placed'] += 1
+        elapsed = time.perf_counter() - start
+        self._record_latency(elapsed)
+        return result
+
+    def _record_latency(self, elapsed: float):
+        attempts = self.stats['placed'] + self.stats['rejected']
+        if len(self.placement_latencies) < self.config.latency_sample_size:
+            self.placement_latencies.append(elapsed)
+        else:
+            slot = self._latency_rng.randrange(attempts)
+            if slot < self.config.latency_sample_size:
+                self.placement_latencies[slot] = elapsed
+        self.stats['elapsed_s'] += elapsed
+        self.stats['max_latency_s'] = max(self.stats['max_latency_s'], elapsed)
+
+    def place_batch(self, tasks: List[Task]) -> List[Dict]:
+        # Most constrained and largest tasks go first so they are not crowded out by easy ones;
+        # results are returned in submission order. Wall time includes the ordering step.
+        start = time.perf_counter()
+        order = sorted(range(len(tasks)), key=lambda i: (-tasks[i].safety_level.value,
+                                                          -tasks[i].compute_demand))
+        results = [None] * len(tasks)
+        for i in order:
+            results[i] = self._place(tasks[i])
+        self.stats['wall_s'] += time.perf_counter() - start
+        return results
+
+    def place_stream(self, tasks: Iterable[Task]) -> Iterator[Dict]:
+        batch = []
+        for task in tasks:
+            batch.append(task)
+            if len(batch) >= self.config.batch_size:
+                yield from self.place_batch(batch)
+                batch = []
+        if batch:
+            yield from self.place_batch(batch)
+
+    def release(self, task_id: str) -> bool:
+        assignment = self.assignments.pop(task_id, None)
+        if assignment is None:
+            return False
+        idx, demand = assignment
+        self.load[idx] = max(0.0, self.load[idx] - demand)
+        self.version[idx] += 1
+        self._push(idx)
+        self.stats['released'] += 1
+        return True
+
+    def refresh_node(self, node_id: str):
+        # Re-tier a node after its trust, latency or safety envelope changed.
+        idx = self.node_index[node_id]
+        node = self.nodes[idx]
+        self.budget[idx] = node.compute_capacity * node.safety_envelope['max_compute_load']
+        self.trust[idx] = node.quantum_trust_score
+        self.latency[idx] = node.network_latency
+
+        old_latency, old_trust = self.envelope[idx]
+        self.envelope[idx] = (node.safety_envelope['max_latency'], node.safety_envelope['quantum_safety_threshold'])
+        self.envelope_latency[old_latency] -= 1
+        self.envelope_trust[old_trust] -= 1
+        self.envelope_latency[self.envelope[idx][0]] += 1
+        self.envelope_trust[self.envelope[idx][1]] += 1
+        self.envelope_latency += Counter()
+        self.envelope_trust += Counter()
+        self._refresh_safety_bounds()
+
+        old_type, old_trust_tier, old_latency_tier = self.node_pool[idx]
+        self.pool_size[old_type][old_trust_tier, old_latency_tier] -= 1
+        self.version[idx] += 1
+        self._sync(self.node_pool[idx])
+        self._index_node(idx)
+
+    def report(self) -> Dict:
+        latencies_ms = np.array(self.placement_latencies) * 1000.0
+        attempts = self.stats['placed'] + self.stats['rejected']
+        wall = self.stats['wall_s']
+        # Rates are over wall time spent in place/place_batch, batch ordering included; the latency
+        # percentiles cover the placement decision of each task alone.
+        return {
+            'placed': self.stats['placed'],
+            'rejected': self.stats['rejected'],
+            'released': self.stats['released'],
+            'placements_per_second': self.stats['placed'] / wall if wall > 0 else 0.0,
+            'attempts_per_second': attempts / wall if wall > 0 else 0.0,
+            'p50_latency_ms': float(np.percentile(latencies_ms, 50)) if attempts else 0.0,
+            'p99_latency_ms': float(np.percentile(latencies_ms, 99)) if attempts else 0.0,
+            'p999_latency_ms': float(np.percentile(latencies_ms, 99.9)) if attempts else 0.0,
+            'max_latency_ms': self.stats['max_latency_s'] * 1000.0,
+            'avg_utilization': float(np.mean(np.array(self.load) / np.maximum(self.budget, 1e-9))),
+            'network_size': len(self.nodes)
+        }
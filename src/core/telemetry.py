@@ -0,0 +1,287 @@
+import queue
+import socket
+import threading
+import time
+import numpy as np
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+TelemetryRecord = Tuple[str, float]
+
+@dataclass
+class TelemetryConfig:
+    batch_size: int = 4096
+    max_batch_delay_s: float = 0.05
+    max_pending_batches: int = 8
+    ewma_alpha: float = 0.05
+    flush_interval_s: float = 0.25
+    poll_interval_s: float = 0.05
+
+def generator_source(records: Iterable[TelemetryRecord]) -> Iterator[TelemetryRecord]:
+    # Malformed records become NaN readings, which ingest_batch drops and counts in events_dropped.
+    for record in records:
+        try:
+            node_id, response_time = record
+            yield node_id, float(response_time)
+        except (TypeError, ValueError):
+            yield '', float('nan')
+
+def _parse_line(line: str) -> Optional[TelemetryRecord]:
+    parts = line.strip().split(',')
+    if len(parts) != 2:
+        return None
+    try:
+        return parts[0], float(parts[1])
+    except ValueError:
+        return None
+
+# Live sources yield None while idle so the pipeline can flush partial batches and notice a stop
+# request; pass them the pipeline's stop_event so they end together with TelemetryIngestionPipeline.run.
+
+def file_tail_source(path: str, stop_event: threading.Event = None,
+                     from_start: bool = True, poll_interval_s: float = 0.05) -> Iterator[Optional[TelemetryRecord]]:
+    # Lines are "node_id,response_time"; keeps following the file until stop_event is set.
+    stop_event = stop_event or threading.Event()
+    with open(path, 'r') as handle:
+        if not from_start:
+            handle.seek(0, 2)
+        partial = ''
+        while True:
+            chunk = handle.readline()
+            if not chunk:
+                if stop_event.is_set():
+                    return
+                yield None
+                time.sleep(poll_interval_s)
+                continue
+            partial += chunk
+            if not partial.endswith('\n'):
+                continue
+            record = _parse_line(partial)
+            partial = ''
+            if record is not None:
+                yield record
+
+def socket_source(sock: socket.socket, stop_event: threading.Event = None, buffer_size: int = 65536,
+                  poll_interval_s: float = 0.05) -> Iterator[Optional[TelemetryRecord]]:
+    # Same line protocol as file_tail_source; ends when the peer closes the connection or stop_event is set.
+    stop_event = stop_event or threading.Event()
+    sock.settimeout(poll_interval_s)
+    pending = b''
+    while not stop_event.is_set():
+        try:
+            data = sock.recv(buffer_size)
+        except socket.timeout:
+            yield None
+            continue
+        if not data:
+            break
+        pending += data
+        lines = pending.split(b'\n')
+        pending = lines.pop()
+        for line in lines:
+            record = _parse_line(line.decode())
+            if record is not None:
+                yield record
+    if pending:
+        record = _parse_line(pending.decode())
+        if record is not None:
+            yield record
+
+def micro_batches(records: Iterable[Optional[TelemetryRecord]], batch_size: int, max_batch_delay_s: float = None,
+                  stop_event: threading.Event = None) -> Iterator[List[TelemetryRecord]]:
+    # A batch is emitted when full, or once its oldest record has waited max_batch_delay_s.
+    batch = []
+    deadline = None
+    for record in records:
+        if stop_event is not None and stop_event.is_set():
+            break
+        if record is not None:
+            if not batch and max_batch_delay_s is not None:
+                deadline = time.monotonic() + max_batch_delay_s
+            batch.append(record)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+                continue
+        if batch and deadline is not None and time.monotonic() >= deadline:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+class TelemetryIngestionPipeline:
+    def __init__(self, nodes: List, config: TelemetryConfig = None, anomaly_detector=None):
+        self.config = config or TelemetryConfig()
+        self.nodes = nodes
+        self.anomaly_detector = anomaly_detector
+        self.node_index = {node.node_id: i for i, node in enumerate(nodes)}
+        self.stop_event = threading.Event()
+
+        n_nodes = len(nodes)
+        initial_mean = np.array([node.behavioral_profile['response_time_mean'] for node in nodes], dtype=np.float64)
+        initial_std = np.array([node.behavioral_profile['response_time_std'] for node in nodes], dtype=np.float64)
+        self.count = np.zeros(n_nodes, dtype=np.int64)
+        self.mean = initial_mean.copy()
+        self.m2 = np.zeros(n_nodes, dtype=np.float64)
+        self.prior_std = initial_std
+        self.ewma_mean = initial_mean
+        self.ewma_var = initial_std ** 2
+        self.dirty = np.zeros(n_nodes, dtype=bool)
+        self.last_flush = time.monotonic()
+
+        self.stats = {
+            'events_ingested': 0,
+            'events_dropped': 0,
+            'batches_processed': 0,
+            'backpressure_waits': 0,
+            'flushes': 0,
+            'nodes_scored': 0,
+            'anomalies_detected': 0
+        }
+
+    def ingest_batch(self, records: List[TelemetryRecord]):
+        lookup = self.node_index.get
+        indices = np.fromiter((lookup(node_id, -1) for node_id, _ in records), dtype=np.int64, count=len(records))
+        values = np.fromiter((value for _, value in records), dtype=np.float64, count=len(records))
+        # Unknown nodes and non-finite readings would poison the running statistics.
+        valid = (indices >= 0) & np.isfinite(values)
+        self.stats['events_dropped'] += int(len(records) - valid.sum())
+        self.update_statistics(indices[valid], values[valid])
+        self.stats['batches_processed'] += 1
+        if time.monotonic() - self.last_flush >= self.config.flush_interval_s:
+            self.flush()
+
+    def update_statistics(self, indices: np.ndarray, values: np.ndarray):
+        if len(indices) == 0:
+            return
+        n_nodes = len(self.nodes)
+        batch_count = np.bincount(indices, minlength=n_nodes)
+        touched = np.nonzero(batch_count)[0]
+        k = batch_count[touched].astype(np.float64)
+        node_mean = np.bincount(indices, weights=values, minlength=n_nodes) / np.maximum(batch_count, 1)
+        batch_mean = node_mean[touched]
+        deviation = values - node_mean[indices]
+        batch_m2 = np.bincount(indices, weights=deviation ** 2, minlength=n_nodes)[touched]
+
+        # Chan et al. parallel combination of the running Welford state with the batch moments.
+        n_prev = self.count[touched].astype(np.float64)
+        n_total = n_prev + k
+        delta = batch_mean - self.mean[touched]
+        self.mean[touched] += delta * k / n_total
+        self.m2[touched] += batch_m2 + delta ** 2 * n_prev * k / n_total
+        self.count[touched] += batch_count[touched]
+
+        # EWMA over the batch mean, with the decay compounded by the number of samples seen.
+        weight = 1.0 - (1.0 - self.config.ewma_alpha) ** k
+        ewma_delta = batch_mean - self.ewma_mean[touched]
+        self.ewma_mean[touched] += weight * ewma_delta
+        self.ewma_var[touched] = (1.0 - weight) * (self.ewma_var[touched] + weight * ewma_delta ** 2) \
+            + weight * batch_m2 / k
+
+        self.dirty[touched] = True
+        self.stats['events_ingested'] += len(indices)
+
+    def flush(self) -> List[Dict]:
+        # Profiles are written back once per flush interval rather than per batch, so a node that
+        # reports many times in between costs a single profile update and a single anomaly score.
+        self.last_flush = time.monotonic()
+        dirty_indices = np.nonzero(self.dirty)[0]
+        if len(dirty_indices) == 0:
+            return []
+        self.dirty[dirty_indices] = False
+        self.stats['flushes'] += 1
+
+        count = self.count[dirty_indices]
+        columns = zip(
+            dirty_indices.tolist(),
+            self.mean[dirty_indices].tolist(),
+            # The sample std needs two readings; until then the node's prior std stands.
+            np.where(count >= 2, np.sqrt(self.m2[dirty_indices] / np.maximum(count - 1, 1)),
+                     self.prior_std[dirty_indices]).tolist(),
+            self.ewma_mean[dirty_indices].tolist(),
+            np.sqrt(self.ewma_var[dirty_indices]).tolist(),
+            count.tolist()
+        )
+        dirty_nodes = []
+        for idx, mean, std, ewma, ewma_std, n in columns:
+            node = self.nodes[idx]
+            node.behavioral_profile.update(
+                response_time_mean=mean,
+                response_time_std=std,
+                response_time_ewma=ewma,
+                response_time_ewma_std=ewma_std,
+                telemetry_count=n
+            )
+            dirty_nodes.append(node)
+
+        detections = []
+        if self.anomaly_detector is not None:
+            detections = self.anomaly_detector.detect_anomalies(dirty_nodes)
+            self.stats['anomalies_detected'] += len(detections)
+        self.stats['nodes_scored'] += len(dirty_nodes)
+        return detections
+
+    def stop(self):
+        # Ends the active run(); the event is cleared again when the next run() starts.
+        self.stop_event.set()
+
+    def run(self, source: Iterable[Optional[TelemetryRecord]], stop_event: threading.Event = None) -> Dict:
+        # A reader thread micro-batches the source into a bounded queue; when the queue is full
+        # the reader blocks, so a slow consumer throttles the source instead of buffering without limit.
+        stop_event = stop_event or self.stop_event
+        stop_event.clear()
+        stats_before = dict(self.stats)
+        poll = self.config.poll_interval_s
+        pending = queue.Queue(maxsize=self.config.max_pending_batches)
+        end_of_stream = object()
+        reader_error = []
+
+        def offer(item) -> bool:
+            while not stop_event.is_set():
+                try:
+                    pending.put(item, timeout=poll)
+                    return True
+                except queue.Full:
+                    self.stats['backpressure_waits'] += 1
+            return False
+
+        def reader():
+            try:
+                for batch in micro_batches(source, self.config.batch_size, self.config.max_batch_delay_s, stop_event):
+                    if not offer(batch):
+                        break
+            except Exception as exc:
+                reader_error.append(exc)
+            finally:
+                offer(end_of_stream)
+
+        start = time.perf_counter()
+        thread = threading.Thread(target=reader, daemon=True)
+        thread.start()
+        try:
+            while True:
+                try:
+                    batch = pending.get(timeout=poll)
+                except queue.Empty:
+                    if not thread.is_alive():
+                        break
+                    if time.monotonic() - self.last_flush >= self.config.flush_interval_s:
+                        self.flush()
+                    continue
+                if batch is end_of_stream:
+                    break
+                self.ingest_batch(batch)
+        finally:
+            stop_event.set()
+            thread.join()
+        self.flush()
+        elapsed = time.perf_counter() - start
+        if reader_error:
+            raise reader_error[0]
+
+        # Per-run figures; self.stats keeps the totals across runs.
+        run_stats = {key: self.stats[key] - stats_before[key] for key in self.stats}
+        run_stats['elapsed_s'] = elapsed
+        run_stats['events_per_second'] = run_stats['events_ingested'] / elapsed if elapsed > 0 else 0.0
+        return run_stats
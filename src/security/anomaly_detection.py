@@ -1,17 +1,18 @@
 import torch
 import torch.nn as nn
+from collections import deque
 from typing import List, Dict
 import numpy as np
 
 class FederatedAnomalyDetector:
-    def __init__(self, nodes: List):
+    def __init__(self, nodes: List, history_size: int = 10000):
         self.nodes = nodes
         self.global_model = self._create_detection_model()
-        self.detection_history = []
+        self.detection_history = deque(maxlen=history_size)
         
     def _create_detection_model(self) -> nn.Module:
         return nn.Sequential(
-            nn.Linear(7, 32),
+            nn.Linear(8, 32),
             nn.Tanh(),
             nn.Linear(32, 16),
             nn.Tanh(),
@@ -29,16 +30,22 @@ class FederatedAnomalyDetector:
             node.compute_capacity / 1000.0,
             node.behavioral_profile['quantum_entanglement'],
             node.behavioral_profile['anomaly_score'],
-            1.0 if node.safety_critical else 0.0
+            1.0 if node.safety_critical else 0.0,
+            (node.behavioral_profile.get('response_time_ewma', node.behavioral_profile['response_time_mean'])
+             - node.network_latency) / 100.0
         ]
         return torch.tensor(features, dtype=torch.float32)
     
-    def detect_anomalies(self) -> List[Dict]:
+    def detect_anomalies(self, nodes: List = None) -> List[Dict]:
+        nodes = self.nodes if nodes is None else nodes
+        if not nodes:
+            return []
+        features = torch.stack([self.extract_quantum_features(node) for node in nodes])
+        with torch.no_grad():
+            anomaly_probs = self.global_model(features).squeeze(-1).tolist()
+        
         detections = []
-        for node in self.nodes:
-            features = self.extract_quantum_features(node)
-            with torch.no_grad():
-                anomaly_prob = self.global_model(features.unsqueeze(0)).item()
+        for node, anomaly_prob in zip(nodes, anomaly_probs):
             node.behavioral_profile['anomaly_score'] = anomaly_prob
             
             if anomaly_prob > 0.7:
@@ -0,0 +1,105 @@
+import numpy as np
+from src.core.nodes import IoRTNode, NodeType, SafetyLevel
+from src.core.scheduler import TaskScheduler, Task
+
+def _fleet(num_nodes: int, rng) -> list:
+    nodes = []
+    for i in range(num_nodes):
+        node = IoRTNode(
+            node_id=f"node_{i:04d}",
+            node_type=list(NodeType)[rng.integers(len(NodeType))],
+            compute_capacity=float(rng.uniform(20, 300)),
+            network_latency=float(rng.uniform(1, 150)),
+            trust_score=float(rng.beta(4, 2)),
+            position=(0.0, 0.0)
+        )
+        if rng.random() < 0.1:
+            node.safety_envelope['max_latency'] = float(rng.uniform(5, 60))
+            node.safety_envelope['quantum_safety_threshold'] = float(rng.uniform(0.5, 0.8))
+        nodes.append(node)
+    return nodes
+
+def _random_task(task_id: str, rng) -> Task:
+    node_types = (list(NodeType)[rng.integers(len(NodeType))],) if rng.random() < 0.3 else None
+    return Task(
+        task_id=task_id,
+        compute_demand=float(rng.uniform(1, 60)),
+        max_latency=float(rng.uniform(5, 150)),
+        min_trust=float(rng.uniform(0.2, 0.9)),
+        safety_level=SafetyLevel(int(rng.integers(1, 5))),
+        node_types=node_types
+    )
+
+def _oracle_best_remaining(scheduler: TaskScheduler, task: Task) -> float:
+    # Linear scan over the fleet using the node objects themselves, not the scheduler's index.
+    best = None
+    for idx, node in enumerate(scheduler.nodes):
+        remaining = scheduler.budget[idx] - scheduler.load[idx]
+        if remaining < task.compute_demand:
+            continue
+        if task.node_types is not None and node.node_type not in task.node_types:
+            continue
+        if node.network_latency > task.max_latency or node.quantum_trust_score < task.min_trust:
+            continue
+        if task.safety_level.value >= SafetyLevel.HIGH.value:
+            envelope = node.safety_envelope
+            if node.network_latency > envelope['max_latency']:
+                continue
+            if node.quantum_trust_score < envelope['quantum_safety_threshold']:
+                continue
+        if best is None or remaining > best:
+            best = remaining
+    return best
+
+def test_place_matches_linear_scan_with_release_and_refresh():
+    rng = np.random.default_rng(7)
+    nodes = _fleet(150, rng)
+    scheduler = TaskScheduler(nodes)
+    active = []
+
+    for step in range(3000):
+        action = rng.random()
+        if action < 0.15 and active:
+            task_id = active.pop(int(rng.integers(len(active))))
+            assert scheduler.release(task_id)
+            continue
+        if action < 0.2:
+            node = nodes[int(rng.integers(len(nodes)))]
+            node.quantum_trust_score = float(rng.uniform(0.2, 1.0))
+            node.network_latency = float(rng.uniform(1, 150))
+            node.safety_envelope = dict(node.safety_envelope, max_latency=float(rng.choice([20.0, 50.0])))
+            scheduler.refresh_node(node.node_id)
+            continue
+
+        task = _random_task(f"task_{step}", rng)
+        expected = _oracle_best_remaining(scheduler, task)
+        result = scheduler.place(task)
+        assert result['success'] == (expected is not None)
+        if result['success']:
+            idx = scheduler.node_index[result['node_id']]
+            chosen_remaining = scheduler.budget[idx] - scheduler.load[idx] + task.compute_demand
+            assert np.isclose(chosen_remaining, expected)
+            active.append(task.task_id)
+
+    assert all(load <= budget + 1e-9 for load, budget in zip(scheduler.load, scheduler.budget))
+    assert scheduler.stats['rejected'] > 0
+
+def test_duplicate_task_id_is_rejected_and_releases_once():
+    node = IoRTNode('n0', NodeType.CLOUD, 100.0, 10.0, 0.9, (0.0, 0.0))
+    scheduler = TaskScheduler([node])
+    assert scheduler.place(Task('a', 1.0))['success']
+    duplicate = scheduler.place(Task('a', 1.0))
+    assert not duplicate['success']
+    assert duplicate['reason'] == 'Task already assigned'
+    assert scheduler.release('a')
+    assert not scheduler.release('a')
+    assert scheduler.load == [0.0]
+
+def test_non_positive_demand_is_rejected():
+    node = IoRTNode('n0', NodeType.CLOUD, 100.0, 10.0, 0.9, (0.0, 0.0))
+    scheduler = TaskScheduler([node])
+    for demand in (0.0, -50.0, float('nan'), float('inf')):
+        result = scheduler.place(Task(f"bad_{demand}", demand))
+        assert not result['success']
+        assert result['reason'] == 'Compute demand must be positive'
+    assert scheduler.load == [0.0]
@@ -0,0 +1,46 @@
+import numpy as np
+from src.core.nodes import IoRTNode, NodeType
+from src.core.telemetry import TelemetryIngestionPipeline, generator_source
+
+def _nodes(count: int = 3) -> list:
+    return [IoRTNode(f"n{i}", NodeType.ROBOT, 100.0, 10.0, 0.8, (0.0, 0.0)) for i in range(count)]
+
+def test_profile_matches_batch_statistics():
+    rng = np.random.default_rng(3)
+    nodes = _nodes()
+    ids = rng.integers(0, len(nodes), 20000)
+    values = rng.normal(20.0, 3.0, len(ids))
+    pipeline = TelemetryIngestionPipeline(nodes)
+    pipeline.run(generator_source(zip([f"n{i}" for i in ids], values.tolist())))
+
+    for i, node in enumerate(nodes):
+        expected = values[ids == i]
+        assert np.isclose(node.behavioral_profile['response_time_mean'], expected.mean())
+        assert np.isclose(node.behavioral_profile['response_time_std'], expected.std(ddof=1))
+        assert node.behavioral_profile['telemetry_count'] == len(expected)
+
+def test_single_reading_keeps_prior_std():
+    nodes = _nodes(1)
+    pipeline = TelemetryIngestionPipeline(nodes)
+    pipeline.run(generator_source([('n0', 12.0)]))
+    assert nodes[0].behavioral_profile['response_time_mean'] == 12.0
+    assert nodes[0].behavioral_profile['response_time_std'] == 1.0
+
+def test_pipeline_can_run_again_with_per_run_stats():
+    nodes = _nodes(1)
+    pipeline = TelemetryIngestionPipeline(nodes)
+    first = pipeline.run(generator_source([('n0', 5.0)] * 10))
+    second = pipeline.run(generator_source([('n0', 7.0)] * 10))
+    assert first['events_ingested'] == 10
+    assert second['events_ingested'] == 10
+    assert pipeline.stats['events_ingested'] == 20
+    assert np.isclose(nodes[0].behavioral_profile['response_time_mean'], 6.0)
+
+def test_bad_readings_are_dropped_and_counted():
+    nodes = _nodes(1)
+    pipeline = TelemetryIngestionPipeline(nodes)
+    records = [('n0', 'fast'), ('n0', float('nan')), ('n0', float('inf')), ('unknown', 1.0), ('n0',), ('n0', 4.0)]
+    result = pipeline.run(generator_source(records))
+    assert result['events_dropped'] == 5
+    assert result['events_ingested'] == 1
+    assert nodes[0].behavioral_profile['response_time_mean'] == 4.0